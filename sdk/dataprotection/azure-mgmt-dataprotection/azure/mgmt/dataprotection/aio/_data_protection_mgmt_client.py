@@ -113,6 +113,12 @@ class DataProtectionMgmtClient:  # pylint: disable=client-accepts-api-version-ke
     :paramtype api_version: str
     :keyword int polling_interval: Default waiting time between two polls for LRO operations if no
      Retry-After header is present.
+    :keyword transport: The async HTTP transport used by every operation group of this client.
+     All operations already share one connection pool per client. To reuse connections across
+     several clients, pass the same
+     ``AioHttpTransport(session=shared_session, session_owner=False)`` to each of them; closing
+     a client then leaves the shared ``aiohttp.ClientSession`` open for the others.
+    :paramtype transport: ~azure.core.pipeline.transport.AsyncHttpTransport
     """
 
     def __init__(
@@ -7,6 +7,7 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 from io import IOBase
+from types import MappingProxyType
 from typing import Any, Callable, Dict, IO, Optional, TypeVar, Union, overload
 
 from azure.core.exceptions import (
@@ -31,6 +32,15 @@ from ...operations._data_protection_operations import build_check_feature_suppor
 T = TypeVar("T")
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+_DEFAULT_ERROR_MAP = MappingProxyType(
+    {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+)
+
 
 class DataProtectionOperations:
     """
@@ -50,6 +60,7 @@ class DataProtectionOperations:
         self._config = input_args.pop(0) if input_args else kwargs.pop("config")
         self._serialize = input_args.pop(0) if input_args else kwargs.pop("serializer")
         self._deserialize = input_args.pop(0) if input_args else kwargs.pop("deserializer")
+        self._check_feature_support_url = DataProtectionOperations.check_feature_support.metadata["url"]
 
     @overload
     async def check_feature_support(
@@ -119,16 +130,13 @@ class DataProtectionOperations:
         :rtype: ~azure.mgmt.dataprotection.models.FeatureValidationResponseBase
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -149,7 +157,7 @@ class DataProtectionOperations:
             content_type=content_type,
             json=_json,
             content=_content,
-            template_url=self.check_feature_support.metadata["url"],
+            template_url=self._check_feature_support_url,
             headers=_headers,
             params=_params,
         )
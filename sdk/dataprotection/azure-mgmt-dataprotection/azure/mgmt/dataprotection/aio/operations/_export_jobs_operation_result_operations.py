@@ -6,6 +6,7 @@
 # Code generated by Microsoft (R) AutoRest Code Generator.
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Optional, TypeVar
 
 from azure.core.exceptions import (
@@ -30,6 +31,15 @@ from ...operations._export_jobs_operation_result_operations import build_get_req
 T = TypeVar("T")
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+_DEFAULT_ERROR_MAP = MappingProxyType(
+    {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+)
+
 
 class ExportJobsOperationResultOperations:
     """
@@ -49,6 +59,7 @@ class ExportJobsOperationResultOperations:
         self._config = input_args.pop(0) if input_args else kwargs.pop("config")
         self._serialize = input_args.pop(0) if input_args else kwargs.pop("serializer")
         self._deserialize = input_args.pop(0) if input_args else kwargs.pop("deserializer")
+        self._get_url = ExportJobsOperationResultOperations.get.metadata["url"]
 
     @distributed_trace_async
     async def get(
@@ -70,16 +81,12 @@ class ExportJobsOperationResultOperations:
         :rtype: ~azure.mgmt.dataprotection.models.ExportJobsResult or None
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[Optional[_models.ExportJobsResult]] = kwargs.pop("cls", None)
@@ -90,7 +97,7 @@ class ExportJobsOperationResultOperations:
             operation_id=operation_id,
             subscription_id=self._config.subscription_id,
             api_version=api_version,
-            template_url=self.get.metadata["url"],
+            template_url=self._get_url,
             headers=_headers,
             params=_params,
         )
@@ -103,14 +110,15 @@ class ExportJobsOperationResultOperations:
         )
 
         response = pipeline_response.http_response
+        status_code = response.status_code
 
-        if response.status_code not in [200, 202]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            raise HttpResponseError(response=response, error_format=ARMErrorFormat)
-
-        deserialized = None
-        if response.status_code == 200:
+        if status_code == 200:
             deserialized = self._deserialize("ExportJobsResult", pipeline_response)
+        elif status_code == 202:
+            deserialized = None
+        else:
+            map_error(status_code=status_code, response=response, error_map=error_map)
+            raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
         if cls:
             return cls(pipeline_response, deserialized, {})
@@ -6,9 +6,44 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from ... import models as _models
+from ._export_jobs_operation_result_operations import (
+    ExportJobsOperationResultOperations as _ExportJobsOperationResultOperations,
+)
+
+
+class ExportJobsOperationResultOperations(_ExportJobsOperationResultOperations):
+    async def get_many(
+        self, operations: Iterable[Tuple[str, str, str]], *, max_concurrency: int = 8, **kwargs: Any
+    ) -> List[Union[Optional[_models.ExportJobsResult], BaseException]]:
+        """Gets the operation results of several Export Jobs operations concurrently.
+
+        The requests share the client's connection pool, and at most ``max_concurrency`` of them
+        are in flight at any time to stay within ARM read throttling limits.
+
+        :param operations: (resource_group_name, vault_name, operation_id) tuples identifying the
+         export job operations to fetch. Required.
+        :type operations: iterable[tuple[str, str, str]]
+        :keyword int max_concurrency: Maximum number of concurrent requests. Default value is 8.
+        :return: One entry per input tuple, in the same order: the ExportJobsResult (or None while
+         the operation is still running) or the exception raised for that operation.
+        :rtype: list[~azure.mgmt.dataprotection.models.ExportJobsResult or None or Exception]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _get_one(operation: Tuple[str, str, str]) -> Optional[_models.ExportJobsResult]:
+            async with semaphore:
+                return await self.get(*operation, **kwargs)
+
+        return await asyncio.gather(*(_get_one(operation) for operation in operations), return_exceptions=True)
+
+
+__all__: List[str] = [
+    "ExportJobsOperationResultOperations"
+]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
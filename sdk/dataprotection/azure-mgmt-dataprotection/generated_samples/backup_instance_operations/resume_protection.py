@@ -6,13 +6,16 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.dataprotection import DataProtectionMgmtClient
+import asyncio
+
+from azure.identity.aio import DefaultAzureCredential
+from azure.mgmt.dataprotection.aio import DataProtectionMgmtClient
 
 """
 # PREREQUISITES
     pip install azure-identity
     pip install azure-mgmt-dataprotection
+    pip install aiohttp
 # USAGE
     python resume_protection.py
 
@@ -20,22 +23,30 @@ from azure.mgmt.dataprotection import DataProtectionMgmtClient
     of the AAD application as environment variables: AZURE_CLIENT_ID, AZURE_TENANT_ID,
     AZURE_CLIENT_SECRET. For more info about how to get the value, please see:
     https://docs.microsoft.com/azure/active-directory/develop/howto-create-service-principal-portal
+
+    Resuming protection usually completes within seconds, so the sample polls every 2 seconds
+    instead of the client's 30 second default. A Retry-After header sent by the service still
+    takes precedence over polling_interval.
+
+    The async client does not block a thread while the operation is polled, so several backup
+    instances can be resumed concurrently with asyncio.gather on the same client.
 """
 
 
-def main():
-    client = DataProtectionMgmtClient(
-        credential=DefaultAzureCredential(),
+async def main():
+    async with DefaultAzureCredential() as credential, DataProtectionMgmtClient(
+        credential=credential,
         subscription_id="04cf684a-d41f-4550-9f70-7708a3a2283b",
-    )
-
-    client.backup_instances.begin_resume_protection(
-        resource_group_name="testrg",
-        vault_name="testvault",
-        backup_instance_name="testbi",
-    ).result()
+    ) as client:
+        poller = await client.backup_instances.begin_resume_protection(
+            resource_group_name="testrg",
+            vault_name="testvault",
+            backup_instance_name="testbi",
+            polling_interval=2,
+        )
+        await poller.result()
 
 
 # x-ms-original-file: specification/dataprotection/resource-manager/Microsoft.DataProtection/stable/2023-11-01/examples/BackupInstanceOperations/ResumeProtection.json
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
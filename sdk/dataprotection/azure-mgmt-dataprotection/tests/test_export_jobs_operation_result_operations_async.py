@@ -0,0 +1,51 @@
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------
+import asyncio
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.dataprotection.aio import DataProtectionMgmtClient
+
+from devtools_testutils import AzureMgmtRecordedTestCase
+from devtools_testutils.fake_transport_async import AsyncStubTransport
+
+ERROR = b'{"error": {"code": "NotFound", "message": "gone"}}'
+
+
+def _export_result(request):
+    operation_id = request.url.split("?")[0].rsplit("/", 1)[-1]
+    if operation_id == "missing":
+        return 404, ERROR
+    if operation_id == "running":
+        return 202, b""
+    return 200, ('{"blobUrl": "https://blob/%s", "blobSasKey": "key"}' % operation_id).encode()
+
+
+class TestDataProtectionMgmtExportJobsOperationResultOperationsAsync(AzureMgmtRecordedTestCase):
+    def setup_method(self, method):
+        self.transport = AsyncStubTransport(_export_result, delay=lambda request: 0.01)
+
+    def get_many(self, operation_ids, **kwargs):
+        async def run():
+            client = self.create_mgmt_client(DataProtectionMgmtClient, is_async=True, transport=self.transport)
+            async with client:
+                return await client.export_jobs_operation_result.get_many(
+                    [("rg", "vault", operation_id) for operation_id in operation_ids], **kwargs
+                )
+
+        return asyncio.run(run())
+
+    def test_get_many_returns_results_in_input_order(self):
+        results = self.get_many(["op1", "running", "op3"])
+        assert [r.blob_url if r else r for r in results] == ["https://blob/op1", None, "https://blob/op3"]
+
+    def test_get_many_returns_failures_in_place(self):
+        results = self.get_many(["op1", "missing", "op3"])
+        assert isinstance(results[1], ResourceNotFoundError)
+        assert [results[0].blob_url, results[2].blob_url] == ["https://blob/op1", "https://blob/op3"]
+
+    def test_get_many_bounds_concurrency(self):
+        results = self.get_many(["op%d" % i for i in range(10)], max_concurrency=3)
+        assert len(results) == 10
+        assert self.transport.max_in_flight == 3
@@ -89,6 +89,13 @@ class DesktopVirtualizationMgmtClient:  # pylint: disable=client-accepts-api-ver
     :keyword api_version: Api Version. Default value is "2023-09-05". Note that overriding this
      default value may result in unsupported behavior.
     :paramtype api_version: str
+    :keyword transport: The async HTTP transport used by every operation group of this client.
+     All operations already share one connection pool per client. For heavy concurrent use, pass
+     ``AioHttpTransport(session=session, session_owner=False)`` built on a
+     ``aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100, limit_per_host=30))``;
+     the connector limits bound the number of open connections and queue the remaining requests,
+     and the same transport can be shared by several clients.
+    :paramtype transport: ~azure.core.pipeline.transport.AsyncHttpTransport
     """
 
     def __init__(
@@ -6,9 +6,12 @@
 # Code generated by Microsoft (R) AutoRest Code Generator.
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
+import asyncio
 from io import IOBase
+from types import MappingProxyType
 from typing import Any, AsyncIterable, Callable, Dict, IO, Optional, TypeVar, Union, overload
 import urllib.parse
+import weakref
 
 from azure.core.async_paging import AsyncItemPaged, AsyncList
 from azure.core.exceptions import (
@@ -40,6 +43,27 @@ from ...operations._scaling_plan_pooled_schedules_operations import (
 T = TypeVar("T")
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+_DEFAULT_ERROR_MAP = MappingProxyType(
+    {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+)
+
+
+def _consume_exception(task: "asyncio.Task[PipelineResponse]") -> None:
+    # a prefetched page is never awaited if the caller stops iterating; retrieve its failure here
+    if not task.cancelled():
+        task.exception()
+
+
+def _cancel_prefetched(prefetched: Dict[str, "asyncio.Task[PipelineResponse]"]) -> None:
+    for task in prefetched.values():
+        task.cancel()
+    prefetched.clear()
+
 
 class ScalingPlanPooledSchedulesOperations:
     """
@@ -59,6 +83,11 @@ class ScalingPlanPooledSchedulesOperations:
         self._config = input_args.pop(0) if input_args else kwargs.pop("config")
         self._serialize = input_args.pop(0) if input_args else kwargs.pop("serializer")
         self._deserialize = input_args.pop(0) if input_args else kwargs.pop("deserializer")
+        self._get_url = ScalingPlanPooledSchedulesOperations.get.metadata["url"]
+        self._create_url = ScalingPlanPooledSchedulesOperations.create.metadata["url"]
+        self._delete_url = ScalingPlanPooledSchedulesOperations.delete.metadata["url"]
+        self._update_url = ScalingPlanPooledSchedulesOperations.update.metadata["url"]
+        self._list_url = ScalingPlanPooledSchedulesOperations.list.metadata["url"]
 
     @distributed_trace_async
     async def get(
@@ -78,16 +107,12 @@ class ScalingPlanPooledSchedulesOperations:
         :rtype: ~azure.mgmt.desktopvirtualization.models.ScalingPlanPooledSchedule
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[_models.ScalingPlanPooledSchedule] = kwargs.pop("cls", None)
@@ -98,7 +123,7 @@ class ScalingPlanPooledSchedulesOperations:
             scaling_plan_schedule_name=scaling_plan_schedule_name,
             subscription_id=self._config.subscription_id,
             api_version=api_version,
-            template_url=self.get.metadata["url"],
+            template_url=self._get_url,
             headers=_headers,
             params=_params,
         )
@@ -221,16 +246,13 @@ class ScalingPlanPooledSchedulesOperations:
         :rtype: ~azure.mgmt.desktopvirtualization.models.ScalingPlanPooledSchedule
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -253,7 +275,7 @@ class ScalingPlanPooledSchedulesOperations:
             content_type=content_type,
             json=_json,
             content=_content,
-            template_url=self.create.metadata["url"],
+            template_url=self._create_url,
             headers=_headers,
             params=_params,
         )
@@ -271,11 +293,7 @@ class ScalingPlanPooledSchedulesOperations:
             map_error(status_code=response.status_code, response=response, error_map=error_map)
             raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
-        if response.status_code == 200:
-            deserialized = self._deserialize("ScalingPlanPooledSchedule", pipeline_response)
-
-        if response.status_code == 201:
-            deserialized = self._deserialize("ScalingPlanPooledSchedule", pipeline_response)
+        deserialized = self._deserialize("ScalingPlanPooledSchedule", pipeline_response)
 
         if cls:
             return cls(pipeline_response, deserialized, {})  # type: ignore
@@ -304,16 +322,12 @@ class ScalingPlanPooledSchedulesOperations:
         :rtype: None
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[None] = kwargs.pop("cls", None)
@@ -324,7 +338,7 @@ class ScalingPlanPooledSchedulesOperations:
             scaling_plan_schedule_name=scaling_plan_schedule_name,
             subscription_id=self._config.subscription_id,
             api_version=api_version,
-            template_url=self.delete.metadata["url"],
+            template_url=self._delete_url,
             headers=_headers,
             params=_params,
         )
@@ -444,16 +458,13 @@ class ScalingPlanPooledSchedulesOperations:
         :rtype: ~azure.mgmt.desktopvirtualization.models.ScalingPlanPooledSchedule
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -479,7 +490,7 @@ class ScalingPlanPooledSchedulesOperations:
             content_type=content_type,
             json=_json,
             content=_content,
-            template_url=self.update.metadata["url"],
+            template_url=self._update_url,
             headers=_headers,
             params=_params,
         )
@@ -531,6 +542,11 @@ class ScalingPlanPooledSchedulesOperations:
         :type is_descending: bool
         :param initial_skip: Initial number of items to skip. Default value is None.
         :type initial_skip: int
+        :keyword bool prefetch: Whether to request the next page as soon as the current one is
+         returned, so that it downloads while the caller is still consuming the current page. At
+         most one page is fetched ahead, and it is cancelled once neither the pager nor any of its
+         page iterators is referenced any more.
+         Default value is False.
         :keyword callable cls: A custom type or function that will be passed the direct response
         :return: An iterator like instance of either ScalingPlanPooledSchedule or the result of
          cls(response)
@@ -539,18 +555,16 @@ class ScalingPlanPooledSchedulesOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[_models.ScalingPlanPooledScheduleList] = kwargs.pop("cls", None)
+        prefetch: bool = kwargs.pop("prefetch", False)
+        _prefetched: Dict[str, "asyncio.Task[PipelineResponse]"] = {}
 
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         def prepare_request(next_link=None):
             if not next_link:
@@ -563,7 +577,7 @@ class ScalingPlanPooledSchedulesOperations:
                     is_descending=is_descending,
                     initial_skip=initial_skip,
                     api_version=api_version,
-                    template_url=self.list.metadata["url"],
+                    template_url=self._list_url,
                     headers=_headers,
                     params=_params,
                 )
@@ -573,15 +587,16 @@ class ScalingPlanPooledSchedulesOperations:
             else:
                 # make call to next link with the client's api-version
                 _parsed_next_link = urllib.parse.urlparse(next_link)
-                _next_request_params = case_insensitive_dict(
-                    {
-                        key: [urllib.parse.quote(v) for v in value]
-                        for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
-                    }
-                )
+                _next_request_params = {
+                    key: [urllib.parse.quote(v) for v in value]
+                    for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
+                    if key.lower() != "api-version"
+                }
                 _next_request_params["api-version"] = self._config.api_version
                 request = HttpRequest(
-                    "GET", urllib.parse.urljoin(next_link, _parsed_next_link.path), params=_next_request_params
+                    "GET",
+                    _parsed_next_link._replace(params="", query="", fragment="").geturl(),
+                    params=_next_request_params,
                 )
                 request = _convert_request(request)
                 request.url = self._client.format_url(request.url)
@@ -593,9 +608,19 @@ class ScalingPlanPooledSchedulesOperations:
             list_of_elem = deserialized.value
             if cls:
                 list_of_elem = cls(list_of_elem)  # type: ignore
+            if prefetch and deserialized.next_link:
+                task = asyncio.ensure_future(fetch_page(deserialized.next_link))
+                task.add_done_callback(_consume_exception)
+                _prefetched[deserialized.next_link] = task
             return deserialized.next_link or None, AsyncList(list_of_elem)
 
         async def get_next(next_link=None):
+            pending = _prefetched.pop(next_link, None) if next_link else None
+            if pending is not None:
+                return await pending
+            return await fetch_page(next_link)
+
+        async def fetch_page(next_link=None):
             request = prepare_request(next_link)
 
             _stream = False
@@ -610,6 +635,10 @@ class ScalingPlanPooledSchedulesOperations:
 
             return pipeline_response
 
+        if prefetch:
+            # get_next is shared by the pager and every page iterator it hands out (by_page()), so
+            # it is only collected once none of them can ask for the prefetched page any more
+            weakref.finalize(get_next, _cancel_prefetched, _prefetched)
         return AsyncItemPaged(get_next, extract_data)
 
     list.metadata = {
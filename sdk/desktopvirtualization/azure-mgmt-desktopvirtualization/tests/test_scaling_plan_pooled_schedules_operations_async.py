@@ -0,0 +1,118 @@
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------
+import asyncio
+import gc
+import json
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.desktopvirtualization.aio import DesktopVirtualizationMgmtClient
+
+from devtools_testutils import AzureMgmtRecordedTestCase
+from devtools_testutils.fake_transport_async import AsyncStubTransport
+
+NEXT_LINK = "https://management.azure.com/next?$skipToken=2"
+LAST_LINK = "https://management.azure.com/next?$skipToken=4"
+ERROR = b'{"error": {"code": "NotFound", "message": "gone"}}'
+
+
+def _page(names, next_link=None):
+    body = {"value": [{"name": name, "properties": {"daysOfWeek": ["Monday"]}} for name in names]}
+    if next_link:
+        body["nextLink"] = next_link
+    return json.dumps(body).encode()
+
+
+def _pending_tasks():
+    return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestDesktopVirtualizationMgmtScalingPlanPooledSchedulesOperationsAsync(AzureMgmtRecordedTestCase):
+    def run_with_client(self, transport, call):
+        async def run():
+            client = self.create_mgmt_client(DesktopVirtualizationMgmtClient, is_async=True, transport=transport)
+            async with client:
+                return await call(client.scaling_plan_pooled_schedules)
+
+        return asyncio.run(run())
+
+    def take_first_and_leave(self, transport):
+        async def call(operations):
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(lambda _, context: errors.append(context))
+            pager = operations.list("rg", "plan", prefetch=True)
+            async for _ in pager:
+                break
+            await _settle()
+            del pager
+            gc.collect()
+            await _settle()
+            return errors, _pending_tasks()
+
+        return self.run_with_client(transport, call)
+
+    def test_list_prefetch_keeps_page_order(self):
+        transport = AsyncStubTransport(
+            [(200, _page(["a", "b"], NEXT_LINK)), (200, _page(["c", "d"], LAST_LINK)), (200, _page(["e"]))]
+        )
+
+        async def call(operations):
+            return [item.name async for item in operations.list("rg", "plan", prefetch=True)]
+
+        assert self.run_with_client(transport, call) == ["a", "b", "c", "d", "e"]
+        assert "skipToken=2" in transport.requests[1].url
+        assert "skipToken=4" in transport.requests[2].url
+
+    def test_list_prefetch_raises_page_errors_in_order(self):
+        transport = AsyncStubTransport([(200, _page(["a", "b"], NEXT_LINK)), (404, ERROR)])
+        seen = []
+
+        async def call(operations):
+            async for item in operations.list("rg", "plan", prefetch=True):
+                seen.append(item.name)
+
+        with pytest.raises(ResourceNotFoundError):
+            self.run_with_client(transport, call)
+        assert seen == ["a", "b"]
+
+    def test_list_prefetch_early_exit_retrieves_failed_page(self):
+        transport = AsyncStubTransport([(200, _page(["a", "b"], NEXT_LINK)), (404, ERROR)])
+        assert self.take_first_and_leave(transport) == ([], [])
+        assert len(transport.requests) == 2
+
+    def test_list_prefetch_early_exit_cancels_pending_page(self):
+        transport = AsyncStubTransport([(200, _page(["a", "b"], NEXT_LINK)), (200, None)])
+        assert self.take_first_and_leave(transport) == ([], [])
+        assert transport.cancelled == 1
+
+    def test_list_prefetch_by_page_outlives_pager(self):
+        transport = AsyncStubTransport(
+            [(200, _page(["a", "b"], NEXT_LINK)), (200, _page(["c", "d"], LAST_LINK)), (200, None)]
+        )
+
+        async def call(operations):
+            pager = operations.list("rg", "plan", prefetch=True)
+            pages = pager.by_page()
+            first = [item.name async for item in await pages.__anext__()]
+            del pager
+            gc.collect()
+            await asyncio.sleep(0)
+            # the page iterator still needs the prefetched page, so dropping the pager keeps it
+            assert transport.cancelled == 0
+            second = [item.name async for item in await pages.__anext__()]
+            await _settle()
+            del pages
+            gc.collect()
+            await _settle()
+            return first, second, _pending_tasks()
+
+        assert self.run_with_client(transport, call) == (["a", "b"], ["c", "d"], [])
+        assert len(transport.requests) == 3
+        assert transport.cancelled == 1
@@ -564,6 +564,8 @@ class Serializer(object):
         self.dependencies: Dict[str, Type[ModelType]] = dict(classes) if classes else {}
         self.key_transformer = full_restapi_key_transformer
         self.client_side_validation = True
+        # Deserializers used by body() to build models from raw input, keyed by XML mode
+        self._body_deserializers: Dict[bool, "Deserializer"] = {}
 
     def _serialize(self, target_obj, data_type=None, **kwargs):
         """Serialize data into a string according to type.
@@ -694,20 +696,23 @@ class Serializer(object):
                 is_xml_model_serialization = False
         if internal_data_type and not isinstance(internal_data_type, Enum):
             try:
-                deserializer = Deserializer(self.dependencies)
-                # Since it's on serialization, it's almost sure that format is not JSON REST
-                # We're not able to deal with additional properties for now.
-                deserializer.additional_properties_detection = False
-                if is_xml_model_serialization:
-                    deserializer.key_extractors = [  # type: ignore
-                        attribute_key_case_insensitive_extractor,
-                    ]
-                else:
-                    deserializer.key_extractors = [
-                        rest_key_case_insensitive_extractor,
-                        attribute_key_case_insensitive_extractor,
-                        last_rest_key_case_insensitive_extractor,
-                    ]
+                deserializer = self._body_deserializers.get(bool(is_xml_model_serialization))
+                if deserializer is None:
+                    deserializer = Deserializer(self.dependencies)
+                    # Since it's on serialization, it's almost sure that format is not JSON REST
+                    # We're not able to deal with additional properties for now.
+                    deserializer.additional_properties_detection = False
+                    if is_xml_model_serialization:
+                        deserializer.key_extractors = [  # type: ignore
+                            attribute_key_case_insensitive_extractor,
+                        ]
+                    else:
+                        deserializer.key_extractors = [
+                            rest_key_case_insensitive_extractor,
+                            attribute_key_case_insensitive_extractor,
+                            last_rest_key_case_insensitive_extractor,
+                        ]
+                    self._body_deserializers[bool(is_xml_model_serialization)] = deserializer
                 data = deserializer._deserialize(data_type, data)
             except DeserializationError as err:
                 raise_with_traceback(SerializationError, "Unable to build a model: " + str(err), err)
@@ -93,6 +93,12 @@ class KustoManagementClient:  # pylint: disable=client-accepts-api-version-keywo
     :paramtype api_version: str
     :keyword int polling_interval: Default waiting time between two polls for LRO operations if no
      Retry-After header is present.
+    :keyword transport: The async HTTP transport used by every operation group of this client.
+     Create the client once and keep it open (``async with``) for the lifetime of the application
+     so that connections are reused instead of re-establishing TLS per call. To share connections
+     with other clients, pass ``AioHttpTransport(session=shared_session, session_owner=False)``;
+     closing the client then leaves the caller-owned ``aiohttp.ClientSession`` open.
+    :paramtype transport: ~azure.core.pipeline.transport.AsyncHttpTransport
     """
 
     def __init__(
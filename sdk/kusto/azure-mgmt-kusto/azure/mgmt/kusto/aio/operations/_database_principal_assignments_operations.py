@@ -7,6 +7,7 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 from io import IOBase
+from types import MappingProxyType
 from typing import Any, AsyncIterable, Callable, Dict, IO, Optional, TypeVar, Union, cast, overload
 import urllib.parse
 
@@ -42,6 +43,29 @@ from ...operations._database_principal_assignments_operations import (
 T = TypeVar("T")
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+_DEFAULT_ERROR_MAP = MappingProxyType(
+    {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+)
+
+_CHECK_NAME_AVAILABILITY_URL = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/checkPrincipalAssignmentNameAvailability"
+_PRINCIPAL_ASSIGNMENT_URL = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
+_PRINCIPAL_ASSIGNMENTS_URL = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments"
+
+
+def _return_pipeline_response(pipeline_response, deserialized, response_headers):  # pylint: disable=unused-argument
+    # cls for the LRO initial calls: hand the raw pipeline response to the poller
+    return pipeline_response
+
+
+def _none_callback(pipeline_response):  # pylint: disable=unused-argument
+    # deserialization_callback for begin_delete when no cls is given: the LRO has no body
+    return None
+
 
 class DatabasePrincipalAssignmentsOperations:
     """
@@ -55,12 +79,15 @@ class DatabasePrincipalAssignmentsOperations:
 
     models = _models
 
-    def __init__(self, *args, **kwargs) -> None:
-        input_args = list(args)
-        self._client = input_args.pop(0) if input_args else kwargs.pop("client")
-        self._config = input_args.pop(0) if input_args else kwargs.pop("config")
-        self._serialize = input_args.pop(0) if input_args else kwargs.pop("serializer")
-        self._deserialize = input_args.pop(0) if input_args else kwargs.pop("deserializer")
+    def __init__(self, client, config, serializer, deserializer) -> None:
+        self._client = client
+        self._config = config
+        self._serialize = serializer
+        self._deserialize = deserializer
+        # Resolved once so requests can be prefixed directly; plain concatenation only matches
+        # format_url() when the base URL carries no query string.
+        base_url = self._client.format_url("")
+        self._base_url = None if "?" in base_url else base_url.rstrip("/")
 
     @overload
     async def check_name_availability(
@@ -155,16 +182,13 @@ class DatabasePrincipalAssignmentsOperations:
         :rtype: ~azure.mgmt.kusto.models.CheckNameResult
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -187,12 +211,15 @@ class DatabasePrincipalAssignmentsOperations:
             content_type=content_type,
             json=_json,
             content=_content,
-            template_url=self.check_name_availability.metadata["url"],
+            template_url=_CHECK_NAME_AVAILABILITY_URL,
             headers=_headers,
             params=_params,
         )
         request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
+        if self._base_url is None:
+            request.url = self._client.format_url(request.url)
+        else:
+            request.url = self._base_url + request.url
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -213,9 +240,7 @@ class DatabasePrincipalAssignmentsOperations:
 
         return deserialized
 
-    check_name_availability.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/checkPrincipalAssignmentNameAvailability"
-    }
+    check_name_availability.metadata = {"url": _CHECK_NAME_AVAILABILITY_URL}
 
     @distributed_trace_async
     async def get(
@@ -242,16 +267,12 @@ class DatabasePrincipalAssignmentsOperations:
         :rtype: ~azure.mgmt.kusto.models.DatabasePrincipalAssignment
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[_models.DatabasePrincipalAssignment] = kwargs.pop("cls", None)
@@ -263,12 +284,15 @@ class DatabasePrincipalAssignmentsOperations:
             principal_assignment_name=principal_assignment_name,
             subscription_id=self._config.subscription_id,
             api_version=api_version,
-            template_url=self.get.metadata["url"],
+            template_url=_PRINCIPAL_ASSIGNMENT_URL,
             headers=_headers,
             params=_params,
         )
         request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
+        if self._base_url is None:
+            request.url = self._client.format_url(request.url)
+        else:
+            request.url = self._base_url + request.url
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -289,9 +313,7 @@ class DatabasePrincipalAssignmentsOperations:
 
         return deserialized
 
-    get.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
-    }
+    get.metadata = {"url": _PRINCIPAL_ASSIGNMENT_URL}
 
     async def _create_or_update_initial(
         self,
@@ -302,16 +324,13 @@ class DatabasePrincipalAssignmentsOperations:
         parameters: Union[_models.DatabasePrincipalAssignment, IO],
         **kwargs: Any
     ) -> _models.DatabasePrincipalAssignment:
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -335,12 +354,15 @@ class DatabasePrincipalAssignmentsOperations:
             content_type=content_type,
             json=_json,
             content=_content,
-            template_url=self._create_or_update_initial.metadata["url"],
+            template_url=_PRINCIPAL_ASSIGNMENT_URL,
             headers=_headers,
             params=_params,
         )
         request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
+        if self._base_url is None:
+            request.url = self._client.format_url(request.url)
+        else:
+            request.url = self._base_url + request.url
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -365,9 +387,7 @@ class DatabasePrincipalAssignmentsOperations:
 
         return deserialized  # type: ignore
 
-    _create_or_update_initial.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
-    }
+    _create_or_update_initial.metadata = {"url": _PRINCIPAL_ASSIGNMENT_URL}
 
     @overload
     async def begin_create_or_update(
@@ -498,8 +518,10 @@ class DatabasePrincipalAssignmentsOperations:
          ~azure.core.polling.AsyncLROPoller[~azure.mgmt.kusto.models.DatabasePrincipalAssignment]
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _headers = kwargs.pop("headers", None)
+        _headers = case_insensitive_dict(_headers) if _headers else {}
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
@@ -516,7 +538,7 @@ class DatabasePrincipalAssignmentsOperations:
                 parameters=parameters,
                 api_version=api_version,
                 content_type=content_type,
-                cls=lambda x, y, z: x,
+                cls=_return_pipeline_response,
                 headers=_headers,
                 params=_params,
                 **kwargs
@@ -544,9 +566,7 @@ class DatabasePrincipalAssignmentsOperations:
             )
         return AsyncLROPoller(self._client, raw_result, get_long_running_output, polling_method)  # type: ignore
 
-    begin_create_or_update.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
-    }
+    begin_create_or_update.metadata = {"url": _PRINCIPAL_ASSIGNMENT_URL}
 
     async def _delete_initial(  # pylint: disable=inconsistent-return-statements
         self,
@@ -556,16 +576,12 @@ class DatabasePrincipalAssignmentsOperations:
         principal_assignment_name: str,
         **kwargs: Any
     ) -> None:
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[None] = kwargs.pop("cls", None)
@@ -577,12 +593,15 @@ class DatabasePrincipalAssignmentsOperations:
             principal_assignment_name=principal_assignment_name,
             subscription_id=self._config.subscription_id,
             api_version=api_version,
-            template_url=self._delete_initial.metadata["url"],
+            template_url=_PRINCIPAL_ASSIGNMENT_URL,
             headers=_headers,
             params=_params,
         )
         request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
+        if self._base_url is None:
+            request.url = self._client.format_url(request.url)
+        else:
+            request.url = self._base_url + request.url
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -606,9 +625,7 @@ class DatabasePrincipalAssignmentsOperations:
         if cls:
             return cls(pipeline_response, None, response_headers)
 
-    _delete_initial.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
-    }
+    _delete_initial.metadata = {"url": _PRINCIPAL_ASSIGNMENT_URL}
 
     @distributed_trace_async
     async def begin_delete(
@@ -643,7 +660,8 @@ class DatabasePrincipalAssignmentsOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[None] = kwargs.pop("cls", None)
@@ -657,15 +675,18 @@ class DatabasePrincipalAssignmentsOperations:
                 database_name=database_name,
                 principal_assignment_name=principal_assignment_name,
                 api_version=api_version,
-                cls=lambda x, y, z: x,
+                cls=_return_pipeline_response,
                 headers=_headers,
                 params=_params,
                 **kwargs
             )
         kwargs.pop("error_map", None)
 
-        def get_long_running_output(pipeline_response):  # pylint: disable=inconsistent-return-statements
-            if cls:
+        if cls is None:
+            get_long_running_output = _none_callback
+        else:
+
+            def get_long_running_output(pipeline_response):
                 return cls(pipeline_response, None, {})
 
         if polling is True:
@@ -683,9 +704,7 @@ class DatabasePrincipalAssignmentsOperations:
             )
         return AsyncLROPoller(self._client, raw_result, get_long_running_output, polling_method)  # type: ignore
 
-    begin_delete.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments/{principalAssignmentName}"
-    }
+    begin_delete.metadata = {"url": _PRINCIPAL_ASSIGNMENT_URL}
 
     @distributed_trace
     def list(
@@ -708,18 +727,14 @@ class DatabasePrincipalAssignmentsOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        _params = kwargs.pop("params", None)
+        _params = case_insensitive_dict(_params) if _params else {}
 
         api_version: str = kwargs.pop("api_version", _params.pop("api-version", self._config.api_version))
         cls: ClsType[_models.DatabasePrincipalAssignmentListResult] = kwargs.pop("cls", None)
 
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        custom_error_map = kwargs.pop("error_map", None)
+        error_map = {**_DEFAULT_ERROR_MAP, **custom_error_map} if custom_error_map else _DEFAULT_ERROR_MAP
 
         def prepare_request(next_link=None):
             if not next_link:
@@ -730,12 +745,15 @@ class DatabasePrincipalAssignmentsOperations:
                     database_name=database_name,
                     subscription_id=self._config.subscription_id,
                     api_version=api_version,
-                    template_url=self.list.metadata["url"],
+                    template_url=_PRINCIPAL_ASSIGNMENTS_URL,
                     headers=_headers,
                     params=_params,
                 )
                 request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
+                if self._base_url is None:
+                    request.url = self._client.format_url(request.url)
+                else:
+                    request.url = self._base_url + request.url
 
             else:
                 # make call to next link with the client's api-version
@@ -780,6 +798,4 @@ class DatabasePrincipalAssignmentsOperations:
 
         return AsyncItemPaged(get_next, extract_data)
 
-    list.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Kusto/clusters/{clusterName}/databases/{databaseName}/principalAssignments"
-    }
+    list.metadata = {"url": _PRINCIPAL_ASSIGNMENTS_URL}
@@ -6,9 +6,97 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import Any, Iterable, List, Tuple, Union
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from azure.core.polling import AsyncLROPoller
+
+from ... import models as _models
+from ._database_principal_assignments_operations import (
+    DatabasePrincipalAssignmentsOperations as _DatabasePrincipalAssignmentsOperations,
+)
+
+
+class DatabasePrincipalAssignmentsOperations(_DatabasePrincipalAssignmentsOperations):
+    async def get_many(
+        self, items: Iterable[Tuple[str, str, str, str]], *, max_concurrency: int = 8, **kwargs: Any
+    ) -> List[Union[_models.DatabasePrincipalAssignment, BaseException]]:
+        """Gets several Kusto cluster database principalAssignments concurrently.
+
+        The requests share the client's connection pool, and at most ``max_concurrency`` of them
+        are in flight at any time to stay within ARM read throttling limits.
+
+        :param items: (resource_group_name, cluster_name, database_name, principal_assignment_name)
+         tuples identifying the principal assignments to fetch. Required.
+        :type items: iterable[tuple[str, str, str, str]]
+        :keyword int max_concurrency: Maximum number of concurrent requests. Default value is 8.
+        :return: One entry per input tuple, in the same order: the DatabasePrincipalAssignment or
+         the exception raised while fetching it.
+        :rtype: list[~azure.mgmt.kusto.models.DatabasePrincipalAssignment or Exception]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _get_one(item: Tuple[str, str, str, str]) -> _models.DatabasePrincipalAssignment:
+            async with semaphore:
+                return await self.get(*item, **kwargs)
+
+        return await asyncio.gather(*(_get_one(item) for item in items), return_exceptions=True)
+
+    async def begin_delete_many(
+        self, items: Iterable[Tuple[str, str, str, str]], *, max_concurrency: int = 8, **kwargs: Any
+    ) -> List[Union[AsyncLROPoller[None], BaseException]]:
+        """Starts deleting several Kusto principalAssignments concurrently.
+
+        The initial DELETE requests are sent concurrently over the client's connection pool, with at
+        most ``max_concurrency`` of them in flight at any time. Each returned poller then polls its
+        own operation; await ``asyncio.gather(*(poller.result() for poller in pollers))`` to wait for
+        all of them.
+
+        :param items: (resource_group_name, cluster_name, database_name, principal_assignment_name)
+         tuples identifying the principal assignments to delete. Required.
+        :type items: iterable[tuple[str, str, str, str]]
+        :keyword int max_concurrency: Maximum number of concurrent initial requests. Default value
+         is 8.
+        :return: One entry per input tuple, in the same order: the AsyncLROPoller for the delete or
+         the exception raised while starting it.
+        :rtype: list[~azure.core.polling.AsyncLROPoller[None] or Exception]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _begin_one(item: Tuple[str, str, str, str]) -> AsyncLROPoller[None]:
+            async with semaphore:
+                return await self.begin_delete(*item, **kwargs)
+
+        return await asyncio.gather(*(_begin_one(item) for item in items), return_exceptions=True)
+
+    async def list_all(
+        self, resource_group_name: str, cluster_name: str, database_name: str, **kwargs: Any
+    ) -> List[_models.DatabasePrincipalAssignment]:
+        """Lists all Kusto cluster database principalAssignments as a list.
+
+        A convenience wrapper that drains :meth:`list` into a list, for callers that want every item
+        at once rather than an async iterator. It sends the same requests as :meth:`list` and is no
+        faster; prefer :meth:`list` when items can be processed as they arrive. Accepts the same
+        keyword arguments as :meth:`list`.
+
+        :param resource_group_name: The name of the resource group. The name is case insensitive.
+         Required.
+        :type resource_group_name: str
+        :param cluster_name: The name of the Kusto cluster. Required.
+        :type cluster_name: str
+        :param database_name: The name of the database in the Kusto cluster. Required.
+        :type database_name: str
+        :keyword callable cls: A custom type or function that will be passed the direct response
+        :return: list of DatabasePrincipalAssignment or the result of cls(response)
+        :rtype: list[~azure.mgmt.kusto.models.DatabasePrincipalAssignment]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return [item async for item in self.list(resource_group_name, cluster_name, database_name, **kwargs)]
+
+
+__all__: List[str] = [
+    "DatabasePrincipalAssignmentsOperations"
+]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
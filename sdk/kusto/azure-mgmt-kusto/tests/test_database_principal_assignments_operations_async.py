@@ -0,0 +1,119 @@
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------
+import asyncio
+import json
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.kusto.aio import KustoManagementClient
+
+from devtools_testutils import AzureMgmtRecordedTestCase
+from devtools_testutils.fake_transport_async import AsyncStubTransport
+
+ERROR = b'{"error": {"code": "NotFound", "message": "gone"}}'
+
+
+def _assignment(name):
+    return {"name": name, "properties": {"role": "Admin", "principalId": "p"}}
+
+
+def _name(request):
+    return request.url.split("?")[0].rsplit("/", 1)[-1]
+
+
+def _first_is_slowest(request):
+    return 0.05 if _name(request) in ("a", "p0") else 0.01
+
+
+def _by_name(request):
+    name = _name(request)
+    if name == "missing":
+        return 404, ERROR
+    if request.method == "DELETE":
+        return 200, b""
+    return 200, json.dumps(_assignment(name)).encode()
+
+
+def _items(names):
+    return [("rg", "cluster", "db", name) for name in names]
+
+
+class TestKustoManagementDatabasePrincipalAssignmentsOperationsAsync(AzureMgmtRecordedTestCase):
+    def run_with_client(self, transport, call):
+        async def run():
+            client = self.create_mgmt_client(KustoManagementClient, is_async=True, transport=transport)
+            async with client:
+                return await call(client.database_principal_assignments)
+
+        return asyncio.run(run())
+
+    def delete_many(self, transport, names, **kwargs):
+        async def call(operations):
+            pollers = await operations.begin_delete_many(_items(names), **kwargs)
+            results = [
+                poller if isinstance(poller, BaseException) else await poller.result() for poller in pollers
+            ]
+            return pollers, results
+
+        return self.run_with_client(transport, call)
+
+    def test_list_all_returns_every_item(self):
+        body = json.dumps({"value": [_assignment("a"), _assignment("b")]}).encode()
+        transport = AsyncStubTransport(lambda _: (200, body))
+        result = self.run_with_client(transport, lambda ops: ops.list_all("rg", "cluster", "db"))
+        assert [item.name for item in result] == ["a", "b"]
+
+    def test_list_all_applies_cls_like_list(self):
+        body = json.dumps({"value": [_assignment("a"), _assignment("b")]}).encode()
+        transport = AsyncStubTransport(lambda _: (200, body))
+        result = self.run_with_client(
+            transport, lambda ops: ops.list_all("rg", "cluster", "db", cls=lambda items: [i.name for i in items])
+        )
+        assert result == ["a", "b"]
+
+    def test_list_all_raises_service_errors(self):
+        transport = AsyncStubTransport(lambda _: (404, ERROR))
+        with pytest.raises(ResourceNotFoundError):
+            self.run_with_client(transport, lambda ops: ops.list_all("rg", "cluster", "db"))
+
+    def test_get_many_returns_results_in_input_order(self):
+        transport = AsyncStubTransport(_by_name, delay=_first_is_slowest)
+        results = self.run_with_client(transport, lambda ops: ops.get_many(_items(["a", "b", "c"])))
+        assert [item.name for item in results] == ["a", "b", "c"]
+
+    def test_get_many_returns_failures_in_place(self):
+        transport = AsyncStubTransport(_by_name)
+        results = self.run_with_client(transport, lambda ops: ops.get_many(_items(["a", "missing", "c"])))
+        assert isinstance(results[1], ResourceNotFoundError)
+        assert [results[0].name, results[2].name] == ["a", "c"]
+
+    def test_get_many_bounds_concurrency(self):
+        transport = AsyncStubTransport(_by_name, delay=lambda request: 0.01)
+        names = ["p%d" % i for i in range(10)]
+        results = self.run_with_client(transport, lambda ops: ops.get_many(_items(names), max_concurrency=3))
+        assert [item.name for item in results] == names
+        assert transport.max_in_flight == 3
+
+    def test_begin_delete_many_returns_pollers_in_input_order(self):
+        transport = AsyncStubTransport(_by_name, delay=_first_is_slowest)
+        pollers, results = self.delete_many(transport, ["a", "b", "c"])
+        assert results == [None, None, None]
+        initial_requests = [
+            poller.polling_method()._initial_response.http_request  # pylint: disable=protected-access
+            for poller in pollers
+        ]
+        assert [_name(request) for request in initial_requests] == ["a", "b", "c"]
+
+    def test_begin_delete_many_returns_failures_in_place(self):
+        transport = AsyncStubTransport(_by_name)
+        pollers, results = self.delete_many(transport, ["a", "missing", "c"])
+        assert isinstance(pollers[1], ResourceNotFoundError)
+        assert [results[0], results[2]] == [None, None]
+
+    def test_begin_delete_many_bounds_concurrency(self):
+        transport = AsyncStubTransport(_by_name, delay=lambda request: 0.01)
+        _, results = self.delete_many(transport, ["p%d" % i for i in range(10)], max_concurrency=3)
+        assert results == [None] * 10
+        assert transport.max_in_flight == 3
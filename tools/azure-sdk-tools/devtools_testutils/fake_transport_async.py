@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+
+
+class AsyncStubTransport(AsyncHttpTransport):
+    """Async transport that answers requests locally, for unit tests of client-side behavior that
+    needs no recording (ordering, concurrency limits, cancellation).
+
+    :param responder: A callable that takes the request and returns a (status_code, body) pair, or a
+        list of such pairs that is answered in order. A body of None never answers: the request stays
+        in flight until it is cancelled.
+    :param delay: An optional callable that takes the request and returns how many seconds to wait
+        before answering. By default each request yields to the event loop once.
+    """
+
+    def __init__(self, responder, delay=None):
+        if not callable(responder):
+            responses = list(responder)
+            responder = lambda request: responses.pop(0)
+        self.responder = responder
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay(request) if self.delay else 0)
+            status, body = self.responder(request)
+            if body is None:
+                await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        response = AsyncHttpResponseImpl(
+            request=request,
+            internal_response=None,
+            status_code=status,
+            headers={"Content-Type": "application/json"},
+            reason="OK" if status < 400 else "Error",
+            content_type="application/json",
+            block_size=4096,
+            stream_download_generator=None,
+        )
+        response._content = body  # pylint: disable=protected-access
+        response._is_closed = True  # pylint: disable=protected-access
+        return response
@@ -15,5 +15,5 @@ class AzureMgmtRecordedTestCase(AzureRecordedTestCase):
 
     def create_mgmt_client(self, client_class, **kwargs):
         subscription_id = self.get_settings_value("SUBSCRIPTION_ID")
-        credential = self.get_credential(client_class)
+        credential = self.get_credential(client_class, is_async=kwargs.pop("is_async", False))
         return self.create_client_from_credential(client_class, credential, subscription_id=subscription_id, **kwargs)